@@ -3,8 +3,10 @@ import datetime
 import json
 import logging
 import os
+import re
 import smtplib
 import ssl
+import time
 import typing as t
 from abc import ABC, abstractmethod
 from email import encoders
@@ -63,6 +65,21 @@ EMAIL_KINDNAME: t.Final[str] = "viur-emails"
 EMAIL_QUEUE: t.Final[str] = "viur-emails"
 """Name of the Cloud Tasks queue"""
 
+_RECIPIENT_OVERRIDE_MAPPING: t.Final[dict[str, str]] = {
+    ".": "_dot_",
+    "@": "_at_",
+}
+"""Replacements made to an original recipient when it is redirected by an `@domain` recipient override"""
+
+_RECIPIENT_OVERRIDE_REGEX: t.Final[re.Pattern] = re.compile(
+    "[" + re.escape("".join(_RECIPIENT_OVERRIDE_MAPPING)) + "]"
+)
+
+ADMIN_RECIPIENTS_CACHE_TTL: t.Final[int] = 300
+"""Seconds the root users queried by :meth:`send_email_to_admins` are cached"""
+
+_admin_recipients_cache: dict[str, t.Any] = {"timestamp": 0.0, "users": None}
+
 AttachmentInline = t.TypedDict("AttachmentInline", {
     "filename": str,
     "content": bytes,
@@ -263,18 +280,33 @@ def send_email_deferred(key: db.Key):
         logging.exception(e)
 
 
-def normalize_to_list(value: None | t.Any | list[t.Any] | t.Callable[[], list]) -> list[t.Any]:
+def _mask_recipient(recipient: str) -> str:
+    """
+    Masks the given recipient address, so that it can be prefixed to an `@domain` recipient override.
+    """
+    return _RECIPIENT_OVERRIDE_REGEX.sub(lambda m: _RECIPIENT_OVERRIDE_MAPPING[m.group()], recipient)
+
+
+def normalize_to_list(
+    value: None | t.Any | list[t.Any] | tuple[t.Any, ...] | t.Callable[[], list | tuple]
+) -> list[t.Any]:
     """
     Convert the given value to a list.
 
     If the value parameter is callable, it will be called first to get the actual value.
+    A tuple is converted into a list with its items.
     """
+    # Fast path for the most common case
+    if isinstance(value, list):
+        return value
     if callable(value):
         value = value()
+        if isinstance(value, list):
+            return value
     if value is None:
         return []
-    if isinstance(value, list):
-        return value
+    if isinstance(value, tuple):
+        return list(value)
     return [value]
 
 
@@ -284,9 +316,9 @@ def send_email(
     stringTemplate: str = None,
     skel: t.Union[None, dict, "SkeletonInstance", list["SkeletonInstance"]] = None,
     sender: str = None,
-    dests: str | list[str] = None,
-    cc: str | list[str] = None,
-    bcc: str | list[str] = None,
+    dests: str | list[str] | tuple[str, ...] = None,
+    cc: str | list[str] | tuple[str, ...] = None,
+    bcc: str | list[str] | tuple[str, ...] = None,
     headers: dict[str, str] = None,
     attachments: list[Attachment] = None,
     context: db.DATASTORE_BASE_TYPES | list[db.DATASTORE_BASE_TYPES] | db.Entity = None,
@@ -303,7 +335,8 @@ def send_email(
         :param skel: The data made available to the template. In case of a Skeleton or SkelList, its parsed the usual way;\
         Dictionaries are passed unchanged.
     :param sender: The address sending this email.
-    :param dests: A list of addresses to send this email to. A bare string will be treated as a list with 1 address.
+    :param dests: A list or tuple of addresses to send this email to.
+        A bare string will be treated as a list with 1 address.
     :param cc: Carbon-copy recipients. A bare string will be treated as a list with 1 address.
     :param bcc: Blind carbon-copy recipients. A bare string will be treated as a list with 1 address.
     :param headers: Specify headers for this email.
@@ -322,8 +355,10 @@ def send_email(
         As emails will be queued (and not send directly) you cannot exceed 1MB in total
         (for all text and attachments combined)!
     """
+    email_conf = conf.email  # Lookup the email config only once
+
     # First, ensure we're able to send email at all
-    transport_class = conf.email.transport_class  # First, ensure we're able to send email at all
+    transport_class = email_conf.transport_class
     if not isinstance(transport_class, EmailTransport):
         raise ValueError(
             f"No or invalid email transport class specified! ({transport_class=}). "
@@ -362,27 +397,27 @@ def send_email(
             attachments.append(entity)
 
     # If conf.email.recipient_override is set we'll redirect any email to these address(es)
-    if conf.email.recipient_override:
-        logging.warning(f"Overriding destination {dests!r} with {conf.email.recipient_override!r}")
+    if recipient_override := email_conf.recipient_override:
+        logging.warning(f"Overriding destination {dests!r} with {recipient_override!r}")
         old_dests = dests
-        new_dests = normalize_to_list(conf.email.recipient_override)
+        new_dests = normalize_to_list(recipient_override)
         dests = []
         for new_dest in new_dests:
             if new_dest.startswith("@"):
                 for old_dest in old_dests:
-                    dests.append(old_dest.replace(".", "_dot_").replace("@", "_at_") + new_dest)
+                    dests.append(_mask_recipient(old_dest) + new_dest)
             else:
                 dests.append(new_dest)
         cc = bcc = []
 
-    elif conf.email.recipient_override is False:
+    elif recipient_override is False:
         logging.warning("Sending emails disabled by config[viur.email.recipientOverride]")
         return False
 
-    if conf.email.sender_override:
-        sender = conf.email.sender_override
+    if sender_override := email_conf.sender_override:
+        sender = sender_override
     elif sender is None:
-        sender = conf.email.sender_default
+        sender = email_conf.sender_default
 
     subject, body = conf.emailRenderer(dests, tpl, stringTemplate, skel, **kwargs)
 
@@ -406,7 +441,7 @@ def send_email(
     transport_class.validate_queue_entity(queued_email)  # Will raise an exception if the entity is not valid
 
     if conf.instance.is_dev_server:
-        if not conf.email.send_from_local_development_server or transport_class is EmailTransportAppengine:
+        if not email_conf.send_from_local_development_server or transport_class is EmailTransportAppengine:
             logging.info("Not sending email from local development server")
             logging.info(f"""Subject: {queued_email["subject"]}""")
             logging.info(f"""Body: {queued_email["body"]}""")
@@ -439,8 +474,18 @@ def send_email_to_admins(subject: str, body: str, *args, **kwargs) -> bool:
         if conf.email.admin_recipients is not None:
             users = normalize_to_list(conf.email.admin_recipients)
         elif "user" in dir(conf.main_app.vi):
-            for user_skel in conf.main_app.vi.user.viewSkel().all().filter("access =", "root").fetch():
-                users.append(user_skel["name"])
+            # Root users change rarely, so avoid a datastore query on every admin email (e.g. on error bursts)
+            if (
+                _admin_recipients_cache["users"] is None
+                or time.time() - _admin_recipients_cache["timestamp"] >= ADMIN_RECIPIENTS_CACHE_TTL
+            ):
+                _admin_recipients_cache["users"] = [
+                    user_skel["name"]
+                    for user_skel in conf.main_app.vi.user.viewSkel().all().filter("access =", "root").fetch()
+                ]
+                _admin_recipients_cache["timestamp"] = time.time()
+
+            users = list(_admin_recipients_cache["users"])
 
         # Prefix the instance's project_id to subject
         subject = f"{conf.instance.project_id}: {subject}"
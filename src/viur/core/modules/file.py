@@ -1,7 +1,7 @@
 import base64
 import datetime
+import functools
 import google.auth
-import hashlib
 import hmac
 import html
 import io
@@ -12,6 +12,7 @@ import PIL.ImageCms
 import re
 import requests
 import string
+import time
 import typing as t
 import warnings
 from collections import namedtuple
@@ -38,6 +39,9 @@ VALID_FILENAME_REGEX = re.compile(
     re.IGNORECASE
 )
 
+# A hex-encoded SHA3-384 HMAC, as created by File.hmac_sign()
+HMAC_SIGNATURE_REGEX = re.compile(r"[0-9a-f]{96}")
+
 _CREDENTIALS, _PROJECT_ID = google.auth.default()
 GOOGLE_STORAGE_CLIENT = storage.Client(_PROJECT_ID, _CREDENTIALS)
 
@@ -51,6 +55,35 @@ _public_bucket = None
 # FilePath is a descriptor for ViUR file components
 FilePath = namedtuple("FilePath", ("dlkey", "is_derived", "filename"))
 
+# Formatted expiry timestamp of download URLs and its minute since the epoch, by the expiry in seconds
+_DOWNLOAD_URL_EXPIRY_CACHE: dict[int, tuple[int, str]] = {}
+
+# Maximum number of different expiries kept in _DOWNLOAD_URL_EXPIRY_CACHE
+_DOWNLOAD_URL_EXPIRY_CACHE_SIZE = 64
+
+
+def _format_download_url_expiry(expires: datetime.timedelta) -> str:
+    """
+    Formats the expiry timestamp of a download URL which expires in *expires* from now.
+
+    As the timestamp only has minute precision, it's formatted once per minute and then served from a cache.
+    The cache is only modified by single item assignments, so it's safe to be used by multiple threads.
+    """
+    seconds = expires.total_seconds()
+    minute = int(time.time() + seconds) // 60
+
+    if (cached := _DOWNLOAD_URL_EXPIRY_CACHE.get(int(seconds))) and cached[0] == minute:
+        return cached[1]
+
+    res = time.strftime("%Y%m%d%H%M", time.localtime(minute * 60))
+
+    if len(_DOWNLOAD_URL_EXPIRY_CACHE) >= _DOWNLOAD_URL_EXPIRY_CACHE_SIZE:
+        _DOWNLOAD_URL_EXPIRY_CACHE.clear()
+
+    # Replaces the timestamp of the previous minute
+    _DOWNLOAD_URL_EXPIRY_CACHE[int(seconds)] = (minute, res)
+    return res
+
 
 def importBlobFromViur2(dlKey, fileName):
     bucket = File.get_bucket(dlKey)
@@ -493,11 +526,29 @@ class File(Tree):
         assert conf.file_hmac_key is not None, "No hmac-key set!"
         if not isinstance(data, bytes):
             data = str(data).encode("UTF-8")
-        return hmac.new(conf.file_hmac_key, msg=data, digestmod=hashlib.sha3_384).hexdigest()
+        return File._hmac_sign_digest(conf.file_hmac_key, data).hex()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _hmac_sign_digest(key: bytes, data: bytes) -> bytes:
+        # Identical data is signed repeatedly, e.g. when rendering download URLs for a list within the same minute.
+        # The digest must stay SHA3-384, as signatures are also verified and issued outside of ViUR (e.g. thumbnailer).
+        return hmac.digest(key, data, "sha3_384")
 
     @staticmethod
     def hmac_verify(data: t.Any, signature: str) -> bool:
-        return hmac.compare_digest(File.hmac_sign(data.encode("ASCII")), signature)
+        assert conf.file_hmac_key is not None, "No hmac-key set!"
+
+        # Only accept signatures in exactly the format issued by hmac_sign()
+        if not isinstance(signature, str) or not HMAC_SIGNATURE_REGEX.fullmatch(signature):
+            return False
+
+        # Compare the raw digests, instead of their hex representations.
+        # Verified data is provided by the client, so it's not passed through the signing cache.
+        return hmac.compare_digest(
+            hmac.digest(conf.file_hmac_key, data.encode("ASCII"), "sha3_384"),
+            bytes.fromhex(signature),
+        )
 
     @staticmethod
     def create_internal_serving_url(
@@ -569,23 +620,72 @@ class File(Tree):
         if isinstance(expires, int):
             expires = datetime.timedelta(minutes=expires)
 
-        # Undo escaping on ()= performed on fileNames
-        filename = filename.replace("&#040;", "(").replace("&#041;", ")").replace("&#061;", "=")
-        filepath = f"""{dlkey}/{"derived" if derived else "source"}/{filename}"""
-
         if download_filename:
             if not File.is_valid_filename(download_filename):
                 raise errors.UnprocessableEntity(f"Invalid download_filename {download_filename!r} provided")
 
             download_filename = urlquote(download_filename)
 
-        expires = (datetime.datetime.now() + expires).strftime("%Y%m%d%H%M") if expires else 0
+        expires = _format_download_url_expiry(expires) if expires else 0
 
-        data = base64.urlsafe_b64encode(f"""{filepath}\0{expires}\0{download_filename or ""}""".encode("UTF-8"))
+        data = File._create_download_url_data(dlkey, filename, derived, expires, download_filename)
         sig = File.hmac_sign(data)
 
         return f"""{File.DOWNLOAD_URL_PREFIX}{data.decode("ASCII")}?sig={sig}"""
 
+    @staticmethod
+    def create_download_urls(
+        files: t.Iterable[tuple[str, str]],
+        derived: bool = False,
+        expires: t.Optional[datetime.timedelta | int] = datetime.timedelta(hours=1),
+    ) -> list[str]:
+        """
+            Utility function that creates signed download-urls for many folder/filename combinations at once.
+
+            Works like :meth:`create_download_url`, but the expiry is only computed once, and the HMAC
+            is only keyed once and then copied for every URL. Use this when rendering lists of files.
+
+            :param files: Pairs of the download-key and the name of the file.
+            :param derived: True, if they point to derived files, False if they point to the original uploaded files
+            :param expires:
+                None if the files are supposed to be public (which causes them to be cached on the google ede caches),
+                otherwise a datetime.timedelta of how long these links should be valid
+            :return: The signed download-urls relative to the current domain (eg /download/...), in the given order.
+        """
+        assert conf.file_hmac_key is not None, "No hmac-key set!"
+
+        if isinstance(expires, int):
+            expires = datetime.timedelta(minutes=expires)
+
+        expires = _format_download_url_expiry(expires) if expires else 0
+        keyed_hmac = hmac.new(conf.file_hmac_key, digestmod="sha3_384")
+
+        res = []
+        for dlkey, filename in files:
+            data = File._create_download_url_data(dlkey, filename, derived, expires)
+            sig = keyed_hmac.copy()
+            sig.update(data)
+            res.append(f"""{File.DOWNLOAD_URL_PREFIX}{data.decode("ASCII")}?sig={sig.hexdigest()}""")
+
+        return res
+
+    @staticmethod
+    def _create_download_url_data(
+        dlkey: str,
+        filename: str,
+        derived: bool,
+        expires: str | int,
+        download_filename: t.Optional[str] = None
+    ) -> bytes:
+        """
+            Creates the encoded data part of a download-url, which is signed.
+        """
+        # Undo escaping on ()= performed on fileNames
+        filename = filename.replace("&#040;", "(").replace("&#041;", ")").replace("&#061;", "=")
+        filepath = f"""{dlkey}/{"derived" if derived else "source"}/{filename}"""
+
+        return base64.urlsafe_b64encode(f"""{filepath}\0{expires}\0{download_filename or ""}""".encode("UTF-8"))
+
     @staticmethod
     def parse_download_url(url) -> t.Optional[FilePath]:
         """
@@ -687,21 +787,24 @@ class File(Tree):
             logging.error("No derives available")
             return ""
 
-        src_set = []
+        filenames = []
+        descriptors = []
         for filename, derivate in file["derived"]["files"].items():
             customData = derivate.get("customData", {})
 
             if width and customData.get("width") in width:
-                src_set.append(
-                    f"""{File.create_download_url(file["dlkey"], filename, True, expires)} {customData["width"]}w"""
-                )
+                filenames.append(filename)
+                descriptors.append(f"""{customData["width"]}w""")
 
             if height and customData.get("height") in height:
-                src_set.append(
-                    f"""{File.create_download_url(file["dlkey"], filename, True, expires)} {customData["height"]}h"""
-                )
+                filenames.append(filename)
+                descriptors.append(f"""{customData["height"]}h""")
+
+        if not filenames:
+            return ""
 
-        return ", ".join(src_set)
+        urls = File.create_download_urls(((file["dlkey"], filename) for filename in filenames), True, expires)
+        return ", ".join(f"{url} {descriptor}" for url, descriptor in zip(urls, descriptors))
 
     def write(
         self,
@@ -1248,16 +1351,40 @@ class File(Tree):
 
         :param dlkey: Unique download-key of the file that shall be marked for deletion.
         """
-        fileObj = db.Query("viur-deleted-files").filter("dlkey", dlkey).getEntry()
+        File.mark_multiple_for_deletion([dlkey])
 
-        if fileObj:  # Its allready marked
-            return
+    @staticmethod
+    def mark_multiple_for_deletion(dlkeys: t.Iterable[str]) -> list[str]:
+        """
+        Adds markers to the datastore that the files specified as *dlkeys* can be deleted.
+
+        Works like :meth:`mark_for_deletion`, but reads and writes all markers in one batch.
+        The markers are keyed by their download-key, so existing markers are looked up by key
+        instead of running a query.
+
+        :param dlkeys: Unique download-keys of the files that shall be marked for deletion.
+        :return: The download-keys which have been newly marked.
+        """
+        if not (dlkeys := list(dict.fromkeys(str(dlkey) for dlkey in dlkeys))):
+            return []
+
+        keys = [db.Key("viur-deleted-files", dlkey) for dlkey in dlkeys]
+        entities = []
+
+        for dlkey, key, existing in zip(dlkeys, keys, db.Get(keys)):
+            if existing:  # It's already marked
+                continue
+
+            entity = db.Entity(key)
+            entity["itercount"] = 0
+            entity["dlkey"] = dlkey
+            entities.append(entity)
 
-        fileObj = db.Entity(db.Key("viur-deleted-files"))
-        fileObj["itercount"] = 0
-        fileObj["dlkey"] = str(dlkey)
+        # Datastore rejects commits with more than 500 mutations
+        for i in range(0, len(entities), 500):
+            db.Put(entities[i:i + 500])
 
-        db.Put(fileObj)
+        return [entity["dlkey"] for entity in entities]
 
     def inject_serving_url(self, skel: SkeletonInstance) -> None:
         """Inject the serving url for public image files into a FileSkel"""
@@ -1301,21 +1428,16 @@ def doCheckForUnreferencedBlobs(cursor=None):
     query = db.Query("viur-blob-locks").filter("has_old_blob_references", True).setCursor(cursor)
     for lockObj in query.run(100):
         oldBlobKeys = db.RunInTransaction(getOldBlobKeysTxn, lockObj.key)
+        staleBlobKeys = []
         for blobKey in oldBlobKeys:
             if db.Query("viur-blob-locks").filter("active_blob_references =", blobKey).getEntry():
                 # This blob is referenced elsewhere
                 logging.info(f"Stale blob is still referenced, {blobKey}")
                 continue
-            # Add a marker and schedule it for deletion
-            fileObj = db.Query("viur-deleted-files").filter("dlkey", blobKey).getEntry()
-            if fileObj:  # Its already marked
-                logging.info(f"Stale blob already marked for deletion, {blobKey}")
-                return
-            fileObj = db.Entity(db.Key("viur-deleted-files"))
-            fileObj["itercount"] = 0
-            fileObj["dlkey"] = str(blobKey)
+            staleBlobKeys.append(blobKey)
+        # Add markers and schedule them for deletion
+        for blobKey in File.mark_multiple_for_deletion(staleBlobKeys):
             logging.info(f"Stale blob marked dirty, {blobKey}")
-            db.Put(fileObj)
     newCursor = query.getCursor()
     if newCursor:
         doCheckForUnreferencedBlobs(newCursor)
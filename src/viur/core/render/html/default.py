@@ -476,14 +476,7 @@ class Render(AbstractRenderer):
             for x in skel:
                 if isinstance(x, SkeletonInstance):
                     x.renderPreparation = self.renderBoneValue
-        if file is not None:
-            try:
-                tpl = self.getEnv().from_string(codecs.open("emails/" + file + ".email", "r", "utf-8").read())
-            except Exception as err:
-                logging.exception(err)
-                tpl = self.getEnv().get_template(file + ".email")
-        else:
-            tpl = self.getEnv().from_string(template)
+        tpl = self.get_email_template(file, template)
         content = tpl.render(skel=skel, dests=dests, **kwargs).lstrip().splitlines()
         if len(content) == 1:
             content.insert(0, "")  # add empty subject
@@ -498,6 +491,34 @@ class Render(AbstractRenderer):
 
         return content[0], os.linesep.join(content[1:]).lstrip()
 
+    def get_email_template(self, file: str = None, template: str = None) -> Template:
+        """
+            Retrieves the compiled template for an email.
+
+            Compiled templates are cached, except on the local development server,
+            so that changes to email templates take effect immediately.
+
+            :param file: The name of a template from the deploy/emails directory.
+            :param template: This string is interpreted as the template contents.
+                Alternative to load from template file.
+            :return: The compiled template.
+        """
+        if conf.instance.is_dev_server:
+            return self._compile_email_template.__wrapped__(self, file, template)
+
+        return self._compile_email_template(file, template)
+
+    @functools.lru_cache(maxsize=256)
+    def _compile_email_template(self, file: str | None, template: str | None) -> Template:
+        if file is not None:
+            try:
+                return self.getEnv().from_string(codecs.open("emails/" + file + ".email", "r", "utf-8").read())
+            except Exception as err:
+                logging.exception(err)
+                return self.getEnv().get_template(file + ".email")
+
+        return self.getEnv().from_string(template)
+
     def getEnv(self) -> Environment:
         """
             Constructs the Jinja2 environment.
@@ -2,6 +2,7 @@ import logging
 import typing as t
 import warnings
 import datetime
+import functools
 from collections.abc import Iterable
 from . import string, parse, json  # noqa: used by external imports
 from viur.core import current, db
@@ -29,22 +30,30 @@ def seoUrlToEntry(module: str,
         If None, the language of the current request is used.
     :return: The path (with a leading /).
     """
-    from viur.core import conf
-    pathComponents = [""]
     if language is None:
         language = current.language.get()
-    if conf.i18n.language_method == "url":
-        pathComponents.append(language)
-    if module in conf.i18n.language_module_map and language in conf.i18n.language_module_map[module]:
-        module = conf.i18n.language_module_map[module][language]
-    pathComponents.append(module)
+
+    # The path to the module doesn't depend on the entry; so it is only built once per request
+    cache = _request_cache("seoUrlToEntry")
+    cacheKey = (module, language)
+    if (modulePath := cache.get(cacheKey)) is None:
+        i18nConf = conf.i18n
+        pathComponents = [""]
+        if i18nConf.language_method == "url":
+            pathComponents.append(language)
+        if (moduleMap := i18nConf.language_module_map.get(module)) and language in moduleMap:
+            module = moduleMap[language]
+        pathComponents.append(module)
+        modulePath = cache[cacheKey] = "/".join(pathComponents)
+
+    pathComponents = [modulePath]
     if not entry:
-        return "/".join(pathComponents)
+        return modulePath
     else:
         try:
             currentSeoKeys = entry["viurCurrentSeoKeys"]
-        except:
-            return "/".join(pathComponents)
+        except (AttributeError, KeyError, TypeError):  # entry is not a skeleton or lacks the seo keys
+            return modulePath
         if language in (currentSeoKeys or {}):
             pathComponents.append(str(currentSeoKeys[language]))
         elif "key" in entry:
@@ -55,17 +64,23 @@ def seoUrlToEntry(module: str,
                 except:
                     pass
             pathComponents.append(str(key.id_or_name) if isinstance(key, db.Key) else str(key))
-        elif "name" in dir(entry):
-            pathComponents.append(str(entry.name))
+        elif (name := getattr(entry, "name", None)) is not None:
+            pathComponents.append(str(name))
         return "/".join(pathComponents)
 
 
 def seoUrlToFunction(module: str, function: str, render: t.Optional[str] = None) -> str:
-    from viur.core import conf
     lang = current.language.get()
-    if module in conf.i18n.language_module_map and lang in conf.i18n.language_module_map[module]:
-        module = conf.i18n.language_module_map[module][lang]
-    if conf.i18n.language_method == "url":
+
+    cache = _request_cache("seoUrlToFunction")
+    cacheKey = (module, function, render, lang)
+    if (path := cache.get(cacheKey)) is not None:
+        return path
+
+    i18nConf = conf.i18n
+    if (moduleMap := i18nConf.language_module_map.get(module)) and lang in moduleMap:
+        module = moduleMap[lang]
+    if i18nConf.language_method == "url":
         pathComponents = ["", lang]
     else:
         pathComponents = [""]
@@ -82,7 +97,21 @@ def seoUrlToFunction(module: str, function: str, render: t.Optional[str] = None)
             pathComponents.append(func.seo_language_map[lang])
         else:
             pathComponents.append(function)
-    return "/".join(pathComponents)
+
+    path = cache[cacheKey] = "/".join(pathComponents)
+    return path
+
+
+def _request_cache(name: str) -> dict:
+    """
+    Returns a dict named *name* which is cached for the lifetime of the current request.
+
+    Outside of a request, a new and empty dict is returned on every call.
+    """
+    if (requestData := current.request_data.get()) is None:
+        return {}
+
+    return requestData.setdefault(name, {})
 
 
 def normalizeKey(key: t.Union[None, 'db.KeyClass']) -> t.Union[None, 'db.KeyClass']:
@@ -95,13 +124,32 @@ def normalizeKey(key: t.Union[None, 'db.KeyClass']) -> t.Union[None, 'db.KeyClas
     """
     if key is None:
         return None
-    if key.parent:
-        parent = normalizeKey(key.parent)
-    else:
-        parent = None
+
+    # Collect the ancestor path, starting with the root key
+    ancestors = []
+    ancestor = key.parent
+    while ancestor:
+        ancestors.insert(0, ancestor)
+        ancestor = ancestor.parent
+
+    # Rebuild the ancestors top-down; shared ancestors are only constructed once
+    parent = None
+    for ancestor in ancestors:
+        parent = _normalize_ancestor_key(ancestor.kind, ancestor.id_or_name, parent)
+
+    # The key itself is always constructed freshly, so callers can't modify a key returned to others
     return db.Key(key.kind, key.id_or_name, parent=parent)
 
 
+@functools.lru_cache(maxsize=8192)
+def _normalize_ancestor_key(
+    kind: str,
+    id_or_name: t.Union[None, int, str],
+    parent: t.Union[None, 'db.KeyClass'],
+) -> 'db.KeyClass':
+    return db.Key(kind, id_or_name, parent=parent)
+
+
 def ensure_iterable(
     obj: t.Any,
     *,
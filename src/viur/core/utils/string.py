@@ -7,6 +7,29 @@ import string
 import warnings
 
 
+# Characters used for random strings
+__STRING_RANDOM_ALPHABET = (string.ascii_letters + string.digits).encode("ASCII")
+
+# Translation table and deletion set mapping random bytes onto the alphabet.
+# The lower 6 bits of each byte are used; values outside the alphabet are dropped to avoid any bias.
+__STRING_RANDOM_TRANSTAB = bytes(
+    __STRING_RANDOM_ALPHABET[(b & 63) % len(__STRING_RANDOM_ALPHABET)] for b in range(256)
+)
+__STRING_RANDOM_DELETE = bytes(b for b in range(256) if (b & 63) >= len(__STRING_RANDOM_ALPHABET))
+
+
+def __random_chars(count: int) -> str:
+    res = b""
+
+    while len(res) < count:
+        # Request some more bytes than needed, as about 3% of them are dropped
+        res += secrets.token_bytes(count - len(res) + count // 16 + 2).translate(
+            __STRING_RANDOM_TRANSTAB, __STRING_RANDOM_DELETE
+        )
+
+    return res[:count].decode("ASCII")
+
+
 def random(length: int = 13) -> str:
     """
     Return a string containing random characters of given *length*.
@@ -17,7 +40,26 @@ def random(length: int = 13) -> str:
 
     :returns: A string with random characters of the given length.
     """
-    return "".join(secrets.choice(string.ascii_letters + string.digits) for _ in range(length))
+    return __random_chars(length)
+
+
+def random_batch(count: int, length: int = 13) -> list[str]:
+    """
+    Return a list of *count* strings containing random characters of given *length*.
+
+    This works like :meth:`random`, but is much faster when many strings are needed at once,
+    as all of them are generated from one chunk of random data.
+
+    :param count: The desired number of strings.
+    :param length: The desired length of each generated string.
+
+    :returns: A list of strings with random characters of the given length.
+    """
+    if not length:
+        return [""] * count
+
+    chars = __random_chars(count * length)
+    return [chars[i:i + length] for i in range(0, count * length, length)]
 
 
 # String base mapping
@@ -36,9 +78,25 @@ __STRING_ESCAPE_MAPPING = {
 # Translation table for string escaping
 __STRING_ESCAPE_TRANSTAB = str.maketrans(__STRING_ESCAPE_MAPPING)
 
+# Regular expression matching any character which needs to be escaped
+__STRING_ESCAPE_REGEX = re.compile("[" + re.escape("".join(__STRING_ESCAPE_MAPPING)) + "]")
+
 # Lookup-table for string unescaping
 __STRING_UNESCAPE_MAPPING = {v: k for k, v in __STRING_ESCAPE_MAPPING.items() if v}
 
+# Regular expression matching any escape sequence which may be unescaped
+__STRING_UNESCAPE_REGEX = re.compile(r"&(\w{2,4}|#0*(\d{2}));")
+
+
+def __unescape_replace(re_match: re.Match) -> str:
+    # In case group 2 is matched, search for its escape sequence
+    if find := re_match.group(2):
+        find = f"&#{find};"
+    else:
+        find = re_match.group(0)
+
+    return __STRING_UNESCAPE_MAPPING.get(find) or re_match.group(0)
+
 
 def escape(val: str, max_length: int | None = 254, maxLength: int | None = None) -> str:
     """
@@ -55,7 +113,11 @@ def escape(val: str, max_length: int | None = 254, maxLength: int | None = None)
         warnings.warn("'maxLength' is deprecated, please use 'max_length'", DeprecationWarning)
         max_length = maxLength
 
-    res = str(val).strip().translate(__STRING_ESCAPE_TRANSTAB)
+    res = str(val).strip()
+
+    # Only translate when there is anything to escape at all
+    if __STRING_ESCAPE_REGEX.search(res):
+        res = res.translate(__STRING_ESCAPE_TRANSTAB)
 
     if max_length:
         return res[:max_length]
@@ -73,16 +135,7 @@ def unescape(val: str) -> str:
 
         :returns: The unquoted string.
     """
-    def __escape_replace(re_match):
-        # In case group 2 is matched, search for its escape sequence
-        if find := re_match.group(2):
-            find = f"&#{find};"
-        else:
-            find = re_match.group(0)
-
-        return __STRING_UNESCAPE_MAPPING.get(find) or re_match.group(0)
-
-    return re.sub(r"&(\w{2,4}|#0*(\d{2}));", __escape_replace, str(val).strip())
+    return __STRING_UNESCAPE_REGEX.sub(__unescape_replace, str(val).strip())
 
 
 def is_prefix(name: str, prefix: str, delimiter: str = ".") -> bool:
@@ -19,6 +19,7 @@ def monkey_patch():
     sys.viur_doc_build = True
 
     MOCK_MODULES = (
+        "google.appengine.api.mail",
         "google.appengine.api",
         "google.auth.default",
         "google.auth",
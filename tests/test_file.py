@@ -0,0 +1,109 @@
+import unittest
+
+
+class TestFile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        from main import monkey_patch
+        monkey_patch()
+
+        from viur.core import conf
+        conf.file_hmac_key = b"unittest-hmac-key"
+
+    def test_hmac_sign_verify(self):
+        from viur.core.modules.file import File
+        data = "dlkey/source/test.txt\0202401011200\0"
+        sig = File.hmac_sign(data)
+        self.assertEqual(96, len(sig))
+        self.assertTrue(File.hmac_verify(data, sig))
+        self.assertFalse(File.hmac_verify(data + "x", sig))
+
+    def test_hmac_verify_format(self):
+        from viur.core.modules.file import File
+        data = "dlkey/source/test.txt\0202401011200\0"
+        sig = File.hmac_sign(data)
+        self.assertFalse(File.hmac_verify(data, sig.upper()))
+        self.assertFalse(File.hmac_verify(data, f"{sig[:2]} {sig[2:]}"))
+        self.assertFalse(File.hmac_verify(data, sig[:-2]))
+        self.assertFalse(File.hmac_verify(data, "zz" + sig[2:]))
+        self.assertFalse(File.hmac_verify(data, None))
+
+    def test_mark_multiple_for_deletion(self):
+        from unittest import mock
+        from viur.core import db
+        from viur.core.modules.file import File
+
+        class Key(tuple):
+            def __new__(cls, kind, name):
+                return super().__new__(cls, (kind, name))
+
+        class Entity(dict):
+            def __init__(self, key):
+                super().__init__()
+                self.key = key
+
+        marked = {Key("viur-deleted-files", "b")}
+
+        with (
+            mock.patch.object(db, "Key", Key),
+            mock.patch.object(db, "Entity", Entity),
+            mock.patch.object(db, "Get", side_effect=lambda keys: [key in marked or None for key in keys]) as get,
+            mock.patch.object(db, "Put") as put,
+        ):
+            self.assertEqual([], File.mark_multiple_for_deletion([]))
+            get.assert_not_called()
+            put.assert_not_called()
+
+            # Duplicates are only looked up once, and already marked files are skipped
+            self.assertEqual(["a", "c"], File.mark_multiple_for_deletion(["a", "b", "a", "c"]))
+            get.assert_called_once_with([Key("viur-deleted-files", x) for x in "abc"])
+            put.assert_called_once()
+            entities = put.call_args.args[0]
+            self.assertEqual([Key("viur-deleted-files", x) for x in "ac"], [entity.key for entity in entities])
+            self.assertEqual([{"itercount": 0, "dlkey": x} for x in "ac"], entities)
+
+            # Nothing is written when all files are already marked
+            put.reset_mock()
+            self.assertEqual([], File.mark_multiple_for_deletion(["b"]))
+            put.assert_not_called()
+
+            # Entities are written in chunks of at most 500
+            dlkeys = [f"key{i}" for i in range(1201)]
+            self.assertEqual(dlkeys, File.mark_multiple_for_deletion(dlkeys))
+            self.assertEqual([500, 500, 201], [len(call.args[0]) for call in put.call_args_list])
+
+    def test_format_download_url_expiry(self):
+        import datetime
+        import threading
+        from viur.core.modules import file
+
+        for expires in (
+            datetime.timedelta(hours=1),
+            datetime.timedelta(seconds=90),
+            datetime.timedelta(days=14, seconds=17),
+        ):
+            expected = {
+                (datetime.datetime.now() + expires + datetime.timedelta(seconds=offset)).strftime("%Y%m%d%H%M")
+                for offset in (0, 1)  # a minute may pass in between
+            }
+            self.assertIn(file._format_download_url_expiry(expires), expected)
+            self.assertIn(file._format_download_url_expiry(expires), expected)
+
+        # The cache stays bounded, also when used by multiple threads
+        errors = []
+
+        def worker(offset):
+            try:
+                for i in range(1000):
+                    file._format_download_url_expiry(datetime.timedelta(seconds=offset + i))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([], errors)
+        self.assertLessEqual(len(file._DOWNLOAD_URL_EXPIRY_CACHE), file._DOWNLOAD_URL_EXPIRY_CACHE_SIZE + 8)
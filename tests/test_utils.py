@@ -24,9 +24,27 @@ class TestUtils(unittest.TestCase):
         from viur.core import utils
         self.assertEqual("None", utils.string.escape(None))
         self.assertEqual("abcde", utils.string.escape("abcdefghi", max_length=5))
+        self.assertEqual("Hello-World_42", utils.string.escape(" Hello-World_42\t"))
+        self.assertEqual("ab", utils.string.escape("a\0b"))
         self.assertEqual("&lt;html&gt; &&lt;/html&gt;", utils.string.escape("<html>\n&\0</html>"))
         self.assertEqual(utils.string.escape(S), E)
 
+    def test_string_random(self):
+        from viur.core import utils
+        import string
+        self.assertEqual("", utils.string.random(0))
+        for length in (1, 13, 100):
+            res = utils.string.random(length)
+            self.assertEqual(length, len(res))
+            self.assertTrue(set(res) <= set(string.ascii_letters + string.digits))
+
+        self.assertEqual([], utils.string.random_batch(0))
+        self.assertEqual(["", ""], utils.string.random_batch(2, 0))
+        res = utils.string.random_batch(100, 13)
+        self.assertEqual(100, len(res))
+        self.assertTrue(all(len(x) == 13 for x in res))
+        self.assertTrue(set("".join(res)) <= set(string.ascii_letters + string.digits))
+
     def test_json(self):
         from viur.core import utils, db
         import datetime